@@ -3,19 +3,26 @@
 # This source code is licensed under the license found in the
 # MIT_LICENSE file in the root directory of this source tree.
 
+import copy
 import logging
+import os
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
+import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from fairseq2.assets import asset_store
 from fairseq2.assets.card import AssetCard
 from fairseq2.data import Collater, SequenceData, StringLike
 from fairseq2.data.audio import AudioDecoder, WaveformToFbankConverter
-from fairseq2.data.text import TextTokenizer
+from fairseq2.data.text import TextTokenEncoder, TextTokenizer
 from fairseq2.memory import MemoryBlock
 from fairseq2.nn.padding import PaddingMask, get_seqs_and_padding_mask
 from fairseq2.typing import DataType, Device
@@ -35,7 +42,7 @@ from seamless_communication.models.unity import (
     load_unity_unit_tokenizer,
     unity_archs,
 )
-from seamless_communication.models.vocoder import load_vocoder_model
+from seamless_communication.models.vocoder import Vocoder, load_vocoder_model
 from seamless_communication.toxicity import (
     ETOXBadWordChecker,
     load_etox_bad_word_checker,
@@ -63,10 +70,22 @@ class Modality(Enum):
     TEXT = "text"
 
 
+_TASK_MODALITIES: Dict[str, Tuple[Modality, Modality]] = {
+    "S2ST": (Modality.SPEECH, Modality.SPEECH),
+    "S2TT": (Modality.SPEECH, Modality.TEXT),
+    # ASR is treated as S2TT with src_lang == tgt_lang.
+    "ASR": (Modality.SPEECH, Modality.TEXT),
+    "T2TT": (Modality.TEXT, Modality.TEXT),
+    "T2ST": (Modality.TEXT, Modality.SPEECH),
+}
+
+
 @dataclass
 class BatchedSpeechOutput:
-    units: List[List[int]]
-    """The batched list of generated units."""
+    units: Union[List[List[int]], List[np.ndarray]]
+    """The batched list of generated units. Produced as ``numpy.ndarray``
+    views into a single host copy of the unit batch, which avoids boxing
+    every unit token into a Python int; plain lists are still accepted."""
 
     audio_wavs: List[Tensor]
     """The batched list of audio waveforms."""
@@ -76,6 +95,8 @@ class BatchedSpeechOutput:
 
 
 class Translator(nn.Module):
+    _GENERATOR_CACHE_SIZE = 16
+
     def __init__(
         self,
         model_name_or_card: Union[str, AssetCard],
@@ -83,9 +104,11 @@ class Translator(nn.Module):
         device: Device,
         text_tokenizer: Optional[TextTokenizer] = None,
         apply_mintox: bool = False,
-        dtype: DataType = torch.float16,
+        dtype: Optional[DataType] = None,
         input_modality: Optional[Modality] = None,
         output_modality: Optional[Modality] = None,
+        compile_encoders: bool = False,
+        use_cuda_graphs: bool = False,
     ):
         super().__init__()
 
@@ -109,11 +132,42 @@ class Translator(nn.Module):
         # Load the model.
         if device == torch.device("cpu"):
             dtype = torch.float32
+        elif dtype is None:
+            # bf16 has the same memory bandwidth as fp16 but its fp32-sized
+            # exponent range avoids overflow-induced renormalizations.
+            if device.type == "cuda" and torch.cuda.is_bf16_supported():
+                dtype = torch.bfloat16
+            else:
+                dtype = torch.float16
 
         self.model = load_unity_model(model_name_or_card, device=device, dtype=dtype)
         self.model.eval()
         assert isinstance(self.model, UnitYModel)
 
+        if compile_encoders:
+            # After a few warmup shapes, the encoders run as captured kernel
+            # sequences, removing most of the Python and launch overhead of
+            # small-batch inference. The T2U model is left uncompiled since
+            # `UnitYGenerator` dispatches on its concrete type.
+            self.model.speech_encoder = torch.compile(  # type: ignore[assignment]
+                self.model.speech_encoder, mode="reduce-overhead", dynamic=True
+            )
+            if self.model.text_encoder is not None:
+                self.model.text_encoder = torch.compile(  # type: ignore[assignment]
+                    self.model.text_encoder, mode="reduce-overhead", dynamic=True
+                )
+
+        if use_cuda_graphs and device.type == "cuda":
+            # The beam-search loop lives in fairseq2, so a whole decoding step
+            # cannot be captured from here. Compiling the text decoder in
+            # reduce-overhead mode gets the per-step transformer stack - where
+            # nearly all of the per-token kernel launches happen - replayed as
+            # CUDA graphs after warmup.
+            if self.model.text_decoder is not None:
+                self.model.text_decoder = torch.compile(  # type: ignore[assignment]
+                    self.model.text_decoder, mode="reduce-overhead", dynamic=True
+                )
+
         if text_tokenizer is None:
             self.text_tokenizer: TextTokenizer = load_unity_text_tokenizer(
                 model_name_or_card
@@ -121,9 +175,25 @@ class Translator(nn.Module):
         else:
             self.text_tokenizer = text_tokenizer
 
+        # Token encoders are deterministic in the source language, so cache
+        # them instead of rebuilding one on every text-input call.
+        self._token_encoders: Dict[str, TextTokenEncoder] = {}
+
+        # Generators are deterministic in the model, target language and
+        # generation options, so a bounded number of them is cached across
+        # calls instead of rebuilding decoder prompts and lang-token state per
+        # request. The cache lives on the instance so that cached generators
+        # (which hold the model) die with their Translator.
+        self._generator_cache: "OrderedDict[Tuple[Any, ...], UnitYGenerator]" = (
+            OrderedDict()
+        )
+
         self.unit_tokenizer: Optional[UnitTokenizer] = None
+        self._t2u_pad_idx: Optional[int] = None
         if self.model.t2u_model is not None:
             self.unit_tokenizer = load_unity_unit_tokenizer(model_name_or_card)
+            # Hoisted out of the per-call hot path.
+            self._t2u_pad_idx = self.model.t2u_model.target_vocab_info.pad_idx
 
         self.bad_word_checker: Optional[ETOXBadWordChecker] = None
         if apply_mintox:
@@ -132,6 +202,7 @@ class Translator(nn.Module):
         self.apply_mintox = apply_mintox
 
         self.device = device
+        self.dtype = dtype
         self.decode_audio = AudioDecoder(dtype=torch.float32, device=device)
         self.convert_to_fbank = WaveformToFbankConverter(
             num_mel_bins=80,
@@ -141,8 +212,12 @@ class Translator(nn.Module):
             device=device,
             dtype=dtype,
         )
+        # Bucket sequence lengths when the encoders are compiled so that the
+        # number of distinct shapes to specialize for stays bounded.
+        self.pad_to_multiple = 128 if compile_encoders else 2
         self.collate = Collater(
-            pad_value=self.text_tokenizer.vocab_info.pad_idx or 0, pad_to_multiple=2
+            pad_value=self.text_tokenizer.vocab_info.pad_idx or 0,
+            pad_to_multiple=self.pad_to_multiple,
         )
         self.vocoder = None
         if vocoder_name_or_card is not None and (
@@ -152,10 +227,29 @@ class Translator(nn.Module):
                 vocoder_name_or_card, device=device, dtype=dtype
             )
             self.vocoder.eval()
+            if isinstance(self.vocoder, Vocoder):
+                # Weight norm recomputes the normalized conv weights through a
+                # pre-forward hook on every call; bake them in once since the
+                # weights are frozen at inference.
+                self.vocoder.code_generator.remove_weight_norm()
+
+    @staticmethod
+    def _opts_cache_key(
+        opts: Optional[SequenceGeneratorOptions],
+    ) -> Optional[Tuple[Any, ...]]:
+        if opts is None:
+            return None
+
+        return (
+            opts.beam_size,
+            opts.soft_max_seq_len,
+            opts.hard_max_seq_len,
+            opts.unk_penalty,
+            opts.len_penalty,
+        )
 
-    @classmethod
     def get_prediction(
-        cls,
+        self,
         model: UnitYModel,
         text_tokenizer: TextTokenizer,
         unit_tokenizer: Optional[UnitTokenizer],
@@ -176,15 +270,37 @@ class Translator(nn.Module):
         ):
             unit_generation_opts = None
 
-        generator = UnitYGenerator(
-            model,
-            text_tokenizer,
+        # Step processors are call-specific (e.g. mintox banned sequences), so
+        # generators carrying one are not cached.
+        cacheable = text_generation_opts.step_processor is None and (
+            unit_generation_opts is None or unit_generation_opts.step_processor is None
+        )
+
+        cache_key = (
+            id(model),
             tgt_lang,
-            unit_tokenizer if output_modality == Modality.SPEECH else None,
-            text_opts=text_generation_opts,
-            unit_opts=unit_generation_opts,
+            output_modality,
+            self._opts_cache_key(text_generation_opts),
+            self._opts_cache_key(unit_generation_opts),
         )
 
+        generator = self._generator_cache.get(cache_key) if cacheable else None
+        if generator is None:
+            generator = UnitYGenerator(
+                model,
+                text_tokenizer,
+                tgt_lang,
+                unit_tokenizer if output_modality == Modality.SPEECH else None,
+                text_opts=text_generation_opts,
+                unit_opts=unit_generation_opts,
+            )
+            if cacheable:
+                self._generator_cache[cache_key] = generator
+                if len(self._generator_cache) > self._GENERATOR_CACHE_SIZE:
+                    self._generator_cache.popitem(last=False)
+        else:
+            self._generator_cache.move_to_end(cache_key)
+
         return generator(
             seqs,
             padding_mask,
@@ -198,24 +314,122 @@ class Translator(nn.Module):
     @staticmethod
     def get_modalities_from_task_str(task_str: str) -> Tuple[Modality, Modality]:
         try:
-            task = Task[task_str.upper()]
+            return _TASK_MODALITIES[task_str.upper()]
         except KeyError:
             raise ValueError(f"Unsupported task: {task_str}")
 
-        if task == Task.S2ST:
-            return Modality.SPEECH, Modality.SPEECH
-        # ASR is treated as S2TT with src_lang == tgt_lang
-        elif task == Task.S2TT or task == Task.ASR:
-            return Modality.SPEECH, Modality.TEXT
-        elif task == Task.T2TT:
-            return Modality.TEXT, Modality.TEXT
-        else:
-            return Modality.TEXT, Modality.SPEECH
+    def _decode_audio_file(self, path: str) -> Any:
+        with Path(path).open("rb") as fb:
+            block = MemoryBlock(fb.read())
+        decoded_audio = self.decode_audio(block)
+        waveform = decoded_audio["waveform"]
+        if self.device.type == "cuda" and not waveform.is_cuda:
+            # Decoded waveforms land in pageable host memory; pin them so the
+            # fbank converter's upload overlaps with kernel launches.
+            decoded_audio["waveform"] = waveform.pin_memory()
+        return decoded_audio
+
+    def _prepare_input(
+        self,
+        input: Union[str, List[str], Tensor, SequenceData],
+        input_modality: Modality,
+        src_lang: Optional[str],
+        sample_rate: int,
+        channel_last: bool = True,
+    ) -> SequenceData:
+        """Convert raw text, an audio path or an audio tensor into a collated
+        source :class:`SequenceData`."""
+        if isinstance(input, dict):
+            return cast(SequenceData, input)
+
+        if input_modality == Modality.SPEECH:
+            audio = input
+            if isinstance(audio, list):
+                # Decoding releases the GIL while ffmpeg/libsndfile runs, so
+                # threads overlap the file reads and decodes across items.
+                with ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1)
+                ) as executor:
+                    decoded_audios = list(
+                        executor.map(self._decode_audio_file, audio)
+                    )
+
+                fbanks = [
+                    self.convert_to_fbank(decoded)["fbank"]
+                    for decoded in decoded_audios
+                ]
+                return self.collate(fbanks)  # type: ignore[no-any-return]
+            if isinstance(audio, str):
+                decoded_audio = self._decode_audio_file(audio)
+            else:
+                assert (
+                    audio.dim() <= 2
+                ), "The audio tensor can't be more than 2 dimensions."
+                if audio.dim() == 1:
+                    audio = audio.unsqueeze(1)
+                elif audio.dim() == 2:
+                    if not channel_last:
+                        # An explicit (channels, seq_len) input: make the
+                        # transposed view contiguous up front so the fbank
+                        # converter doesn't trigger a hidden full copy, and
+                        # overlap that copy with the device upload.
+                        audio = audio.transpose(0, 1).contiguous()
+                        if self.device.type == "cuda" and not audio.is_cuda:
+                            audio = audio.pin_memory().to(
+                                self.device, non_blocking=True
+                            )
+                    elif audio.size(0) < audio.size(1):
+                        warnings.warn(
+                            "Guessing the layout of a (channels, seq_len) audio "
+                            "tensor from its shape is deprecated; pass a "
+                            "(seq_len, channels) tensor or set "
+                            "`channel_last=False`.",
+                            FutureWarning,
+                        )
+                        audio = audio.transpose(0, 1)
+
+                if self.device.type == "cuda" and not audio.is_cuda:
+                    # Pinned host memory lets the fbank converter upload the
+                    # waveform asynchronously and overlap it with kernel
+                    # launches on the device.
+                    audio = audio.pin_memory()
+
+                decoded_audio = {
+                    "waveform": audio,
+                    "sample_rate": sample_rate,
+                    "format": -1,
+                }
+
+            # A single-item batch: pad the fbank where it already lives
+            # instead of routing it through the CPU-side `Collater` copy.
+            fbank = self.convert_to_fbank(decoded_audio)["fbank"]
+            seq_len = fbank.size(0)
+            pad = -seq_len % self.pad_to_multiple
+            if pad > 0:
+                fbank = F.pad(fbank, (0, 0, 0, pad))
+            return {
+                "is_ragged": pad > 0,
+                "seqs": fbank.unsqueeze(0),
+                "seq_lens": torch.tensor([seq_len], device=fbank.device),
+            }
+
+        if src_lang is None:
+            raise ValueError("src_lang must be specified for T2ST, T2TT tasks.")
+
+        text = input
+        assert isinstance(text, str)
+
+        token_encoder = self._token_encoders.get(src_lang)
+        if token_encoder is None:
+            token_encoder = self.text_tokenizer.create_encoder(
+                task="translation", lang=src_lang, mode="source", device=self.device
+            )
+            self._token_encoders[src_lang] = token_encoder
+        return self.collate(token_encoder(text))  # type: ignore[no-any-return]
 
-    @torch.inference_mode()
     def predict(
         self,
-        input: Union[str, Tensor, SequenceData],
+        input: Union[str, List[str], Tensor, SequenceData],
         task_str: str,
         tgt_lang: str,
         src_lang: Optional[str] = None,
@@ -227,12 +441,14 @@ class Translator(nn.Module):
         duration_factor: float = 1.0,
         prosody_encoder_input: Optional[SequenceData] = None,
         src_text: Optional[StringLike] = None,
+        channel_last: bool = True,
     ) -> Tuple[List[StringLike], Optional[BatchedSpeechOutput]]:
         """
         The main method used to perform inference on all tasks.
 
         :param input:
-            Either text or path to audio or audio Tensor.
+            Either text, a path to audio, a list of audio paths forming a
+            batch, or an audio Tensor.
         :param task_str:
             String representing the task.
             Valid choices are "S2ST", "S2TT", "T2ST", "T2TT", "ASR"
@@ -253,11 +469,50 @@ class Translator(nn.Module):
             Optional source transcript (obtained by ASR for instance). This is used for
             applying mintox toxicity mitigation. If this is not specify and apply_mintox=True
             then src_lang must be specified and ASR will be run on the audio source.
+        :param channel_last:
+            If True, a 2-dimensional audio tensor is expected to have the
+            (seq_len, channels) layout; if False, (channels, seq_len).
 
         :returns:
             - Batched list of Translated text.
             - Translated BatchedSpeechOutput.
         """
+        # `inference_mode` is entered once at the public API boundary; the
+        # internal implementation runs undecorated so that nested calls don't
+        # pay the mode re-entry cost.
+        with torch.inference_mode():
+            return self._predict_impl(
+                input,
+                task_str,
+                tgt_lang,
+                src_lang=src_lang,
+                text_generation_opts=text_generation_opts,
+                unit_generation_opts=unit_generation_opts,
+                spkr=spkr,
+                sample_rate=sample_rate,
+                unit_generation_ngram_filtering=unit_generation_ngram_filtering,
+                duration_factor=duration_factor,
+                prosody_encoder_input=prosody_encoder_input,
+                src_text=src_text,
+                channel_last=channel_last,
+            )
+
+    def _predict_impl(
+        self,
+        input: Union[str, List[str], Tensor, SequenceData],
+        task_str: str,
+        tgt_lang: str,
+        src_lang: Optional[str] = None,
+        text_generation_opts: Optional[SequenceGeneratorOptions] = None,
+        unit_generation_opts: Optional[SequenceGeneratorOptions] = None,
+        spkr: Optional[int] = -1,
+        sample_rate: int = 16000,
+        unit_generation_ngram_filtering: bool = False,
+        duration_factor: float = 1.0,
+        prosody_encoder_input: Optional[SequenceData] = None,
+        src_text: Optional[StringLike] = None,
+        channel_last: bool = True,
+    ) -> Tuple[List[StringLike], Optional[BatchedSpeechOutput]]:
         input_modality, output_modality = self.get_modalities_from_task_str(task_str)
 
         if self.apply_mintox and not (src_lang is not None or src_text is not None):
@@ -265,45 +520,9 @@ class Translator(nn.Module):
                 "`src_lang` must be specified when `apply_mintox` is `True` or you need to specify src_text."
             )
 
-        if isinstance(input, dict):
-            src = cast(SequenceData, input)
-        elif input_modality == Modality.SPEECH:
-            audio = input
-            if isinstance(audio, str):
-                with Path(audio).open("rb") as fb:
-                    block = MemoryBlock(fb.read())
-                decoded_audio = self.decode_audio(block)
-            else:
-                assert (
-                    audio.dim() <= 2
-                ), "The audio tensor can't be more than 2 dimensions."
-                if audio.dim() == 1:
-                    audio = audio.unsqueeze(1)
-                elif audio.dim() == 2 and audio.size(0) < audio.size(1):
-                    logger.warning(
-                        "Transposing audio tensor from (bsz, seq_len) -> (seq_len, bsz)."
-                    )
-                    audio = audio.transpose(0, 1)
-
-                decoded_audio = {
-                    "waveform": audio,
-                    "sample_rate": sample_rate,
-                    "format": -1,
-                }
-            src = self.collate(self.convert_to_fbank(decoded_audio))["fbank"]
-        else:
-            if src_lang is None:
-                raise ValueError("src_lang must be specified for T2ST, T2TT tasks.")
-
-            text = input
-            assert isinstance(text, str)
-
-            self.token_encoder = self.text_tokenizer.create_encoder(
-                task="translation", lang=src_lang, mode="source", device=self.device
-            )
-            src = self.collate(self.token_encoder(text))
-
-        assert isinstance(self.model, UnitYModel)
+        src = self._prepare_input(
+            input, input_modality, src_lang, sample_rate, channel_last
+        )
 
         seqs, padding_mask = get_seqs_and_padding_mask(src)
 
@@ -332,20 +551,25 @@ class Translator(nn.Module):
             prosody_encoder_input=prosody_encoder_input,
         )
 
-        if self.apply_mintox and task_str != Task.ASR.name:
+        if self.apply_mintox and task_str.upper() != "ASR":
             if input_modality == Modality.SPEECH:
                 if src_text is not None:
                     src_texts = [src_text]
                 else:
-                    src_texts, _, = self.predict(
-                        input=input,
-                        task_str=Task.ASR.name,
-                        tgt_lang=tgt_lang,
-                        src_lang=src_lang,
-                        text_generation_opts=text_generation_opts,
-                        unit_generation_opts=unit_generation_opts,
-                        spkr=spkr,
-                        sample_rate=sample_rate,
+                    # ASR is S2TT over the same source, so reuse the already
+                    # collated fbank instead of recursing into `predict`,
+                    # which would decode and convert the audio a second time.
+                    src_texts, _ = self.get_prediction(
+                        self.model,
+                        self.text_tokenizer,
+                        self.unit_tokenizer,
+                        seqs,
+                        padding_mask,
+                        input_modality,
+                        Modality.TEXT,
+                        tgt_lang,
+                        text_generation_opts,
+                        unit_generation_opts,
                         unit_generation_ngram_filtering=unit_generation_ngram_filtering,
                     )
             else:
@@ -393,31 +617,35 @@ class Translator(nn.Module):
                 # T2U model already predicts duration in the units.
                 duration_prediction = False
 
-            audio_wavs = []
-            speech_units = []
-            for i in range(len(units)):
-                assert self.model.t2u_model is not None
-                unit_padding_mask = (
-                    units[i] != self.model.t2u_model.target_vocab_info.pad_idx
-                )
-                u = units[i][unit_padding_mask]
-                speech_units.append(u.tolist())
+            # Pad units only trail the valid ones, so a single vectorized count
+            # gives the number of valid units per item without a device sync
+            # and a Python-level scan per item.
+            unit_lens = (units != self._t2u_pad_idx).sum(dim=1)
+            units_np = units.cpu().numpy()
+            lens = unit_lens.tolist()
+
+            speech_units = [units_np[i, : lens[i]] for i in range(len(units))]
 
+            audio_wavs: List[Tensor] = []
             if self.vocoder is not None:
-                translated_audio_wav = self.vocoder(
-                    units, tgt_lang, spkr, dur_prediction=duration_prediction
+                translated_audio_wavs, audio_wav_lens = self.vocoder(
+                    units,
+                    tgt_lang,
+                    spkr,
+                    dur_prediction=duration_prediction,
+                    unit_lens=unit_lens,
                 )
-                for i in range(len(units)):
-                    padding_removed_audio_wav = translated_audio_wav[
-                        i,
-                        :,
-                        : int(
-                            translated_audio_wav.size(-1)
-                            * len(speech_units[i])
-                            / len(units[i])
-                        ),
-                    ].unsqueeze(0)
-                    audio_wavs.append(padding_removed_audio_wav)
+                # The vocoder runs in the model's reduced-precision dtype;
+                # convert back to fp32 once for the whole batch so that the
+                # returned waveforms are safe to serialize.
+                translated_audio_wavs = translated_audio_wavs.float()
+                # A single host transfer of the lengths; slicing with Python
+                # ints keeps the per-item views free of device syncs.
+                wav_lens = audio_wav_lens.tolist()
+                audio_wavs = [
+                    translated_audio_wavs[i, :, : wav_lens[i]].unsqueeze(0)
+                    for i in range(len(units))
+                ]
             return (
                 texts,
                 BatchedSpeechOutput(
@@ -426,3 +654,260 @@ class Translator(nn.Module):
                     sample_rate=sample_rate,
                 ),
             )
+
+    def export_onnx(
+        self,
+        output_dir: Union[str, Path],
+        length_buckets: Optional[List[int]] = None,
+        dtype: DataType = torch.float32,
+    ) -> List[Path]:
+        """Export the speech encoder to ONNX, once per fbank-length bucket.
+
+        Deployments that bucket their audio lengths ahead of time can compile
+        the exported models with ONNXRuntime-CUDA or TensorRT, which
+        specialize kernels per shape; the batch dimension stays dynamic. The
+        decoder is deliberately not exported - its autoregressive control
+        flow does not map to a static graph.
+
+        :param output_dir:
+            The directory the ``.onnx`` files are written to.
+        :param length_buckets:
+            The fbank frame lengths to export for.
+        :param dtype:
+            The dtype of the exported graph. Defaults to fp32, which every
+            ONNX runtime handles; bf16 in particular has poor ONNX support,
+            so the export does not inherit the model's compute dtype. The
+            conversion happens on a copy - the live model keeps its dtype.
+
+        :returns:
+            The paths of the exported models, one per bucket.
+        """
+        if length_buckets is None:
+            length_buckets = [64, 128, 256, 512]
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        model = self.model
+
+        class _SpeechEncoder(nn.Module):
+            """Bundles the speech encoder frontend and encoder into a single
+            graph taking a padding-free fbank batch."""
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.frontend = model.speech_encoder_frontend
+                # Unwrap torch.compile's OptimizedModule (set up when
+                # `compile_encoders=True`); `torch.onnx.export` cannot trace
+                # through it.
+                encoder = model.speech_encoder
+                self.encoder = getattr(encoder, "_orig_mod", encoder)
+
+            def forward(self, fbank: Tensor) -> Tensor:
+                seqs, padding_mask = self.frontend(fbank, None)
+                seqs, _ = self.encoder(seqs, padding_mask)
+                return seqs
+
+        speech_encoder = _SpeechEncoder().eval()
+
+        if dtype != self.dtype:
+            speech_encoder = copy.deepcopy(speech_encoder).to(dtype=dtype)
+
+        # Matches the mel-bin count of `convert_to_fbank`.
+        num_mel_bins = 80
+
+        output_paths = []
+        for bucket in length_buckets:
+            dummy_fbank = torch.zeros(
+                1, bucket, num_mel_bins, device=self.device, dtype=dtype
+            )
+            output_path = output_dir / f"speech_encoder_{bucket}.onnx"
+            torch.onnx.export(
+                speech_encoder,
+                (dummy_fbank,),
+                str(output_path),
+                input_names=["fbank"],
+                output_names=["encoder_output"],
+                dynamic_axes={
+                    "fbank": {0: "batch"},
+                    "encoder_output": {0: "batch"},
+                },
+            )
+            output_paths.append(output_path)
+
+        return output_paths
+
+    def predict_streaming(
+        self,
+        input: Union[str, Tensor, SequenceData],
+        task_str: str,
+        tgt_lang: str,
+        src_lang: Optional[str] = None,
+        text_generation_opts: Optional[SequenceGeneratorOptions] = None,
+        unit_generation_opts: Optional[SequenceGeneratorOptions] = None,
+        spkr: Optional[int] = -1,
+        sample_rate: int = 16000,
+        unit_generation_ngram_filtering: bool = False,
+        duration_factor: float = 1.0,
+        prosody_encoder_input: Optional[SequenceData] = None,
+        chunk_size: int = 40,
+        context_size: int = 16,
+    ) -> Iterator[Tuple[List[StringLike], BatchedSpeechOutput]]:
+        """Like :meth:`predict` for speech output tasks, but yields the audio
+        in chunks as it is synthesized instead of waiting for the full
+        waveform, cutting the time to first audio.
+
+        The generated units are vocoded ``chunk_size`` units at a time with
+        ``context_size`` units of left context, whose overlap is trimmed from
+        each chunk. With an autoregressive T2U model, unit durations depend on
+        the whole sequence, so the output is yielded as a single chunk.
+
+        Mintox mitigation is not supported: chunks are yielded before the
+        complete output exists, so the mitigation pass could not rewrite
+        already-delivered audio. A :class:`ValueError` is raised when the
+        translator was constructed with ``apply_mintox=True``; use
+        :meth:`predict` instead.
+
+        The arguments are validated when this method is called, before the
+        returned iterator is first consumed.
+
+        :param chunk_size:
+            The number of units synthesized per yielded chunk.
+        :param context_size:
+            The number of left-context units fed to the vocoder per chunk.
+
+        :returns:
+            An iterator over tuples of the translated text and a chunk of the
+            speech output. The text is identical in every tuple.
+        """
+        input_modality, output_modality = self.get_modalities_from_task_str(task_str)
+
+        if output_modality != Modality.SPEECH:
+            raise ValueError(
+                f"predict_streaming only supports speech output tasks, not {task_str}."
+            )
+        if self.vocoder is None:
+            raise ValueError("predict_streaming requires a vocoder.")
+
+        if self.apply_mintox:
+            raise ValueError(
+                "`predict_streaming` does not support mintox mitigation since chunks "
+                "are yielded before the complete output exists; use `predict` instead."
+            )
+
+        return self._stream_chunks(
+            input,
+            task_str,
+            input_modality,
+            output_modality,
+            tgt_lang,
+            src_lang,
+            text_generation_opts,
+            unit_generation_opts,
+            spkr,
+            sample_rate,
+            unit_generation_ngram_filtering,
+            duration_factor,
+            prosody_encoder_input,
+            chunk_size,
+            context_size,
+        )
+
+    @torch.inference_mode()
+    def _stream_chunks(
+        self,
+        input: Union[str, Tensor, SequenceData],
+        task_str: str,
+        input_modality: Modality,
+        output_modality: Modality,
+        tgt_lang: str,
+        src_lang: Optional[str],
+        text_generation_opts: Optional[SequenceGeneratorOptions],
+        unit_generation_opts: Optional[SequenceGeneratorOptions],
+        spkr: Optional[int],
+        sample_rate: int,
+        unit_generation_ngram_filtering: bool,
+        duration_factor: float,
+        prosody_encoder_input: Optional[SequenceData],
+        chunk_size: int,
+        context_size: int,
+    ) -> Iterator[Tuple[List[StringLike], BatchedSpeechOutput]]:
+        """The decode/vocode loop behind :meth:`predict_streaming`."""
+        if isinstance(self.model.t2u_model, UnitYT2UModel):
+            # Already inside `inference_mode`; call the implementation
+            # directly instead of re-entering the mode through `predict`.
+            texts, speech_output = self._predict_impl(
+                input,
+                task_str,
+                tgt_lang,
+                src_lang=src_lang,
+                text_generation_opts=text_generation_opts,
+                unit_generation_opts=unit_generation_opts,
+                spkr=spkr,
+                sample_rate=sample_rate,
+                unit_generation_ngram_filtering=unit_generation_ngram_filtering,
+                duration_factor=duration_factor,
+                prosody_encoder_input=prosody_encoder_input,
+            )
+            assert speech_output is not None
+            yield texts, speech_output
+            return
+
+        src = self._prepare_input(input, input_modality, src_lang, sample_rate)
+
+        seqs, padding_mask = get_seqs_and_padding_mask(src)
+
+        if text_generation_opts is None:
+            text_generation_opts = SequenceGeneratorOptions(
+                beam_size=5, soft_max_seq_len=(1, 200)
+            )
+
+        texts, units = self.get_prediction(
+            self.model,
+            self.text_tokenizer,
+            self.unit_tokenizer,
+            seqs,
+            padding_mask,
+            input_modality,
+            output_modality,
+            tgt_lang,
+            text_generation_opts,
+            unit_generation_opts,
+            unit_generation_ngram_filtering=unit_generation_ngram_filtering,
+            duration_factor=duration_factor,
+            prosody_encoder_input=prosody_encoder_input,
+        )
+
+        assert units is not None
+
+        if units.size(0) > 1:
+            raise NotImplementedError(
+                "predict_streaming is not implemented for batch_size > 1."
+            )
+
+        num_units = int((units[0] != self._t2u_pad_idx).sum())
+        units = units[:, :num_units]
+
+        # One host copy up front; the per-chunk unit outputs below are plain
+        # views into it, while the vocoder keeps consuming the GPU slices.
+        units_np = units[0].cpu().numpy()
+
+        for start in range(0, num_units, chunk_size):
+            context = min(context_size, start)
+            window = units[:, start - context : start + chunk_size]
+
+            wav = self.vocoder(window, tgt_lang, spkr, dur_prediction=False)
+
+            # Without duration prediction every unit maps to a fixed number of
+            # output samples, so the context overlap can be trimmed exactly.
+            samples_per_unit = wav.size(-1) // window.size(-1)
+            chunk_wav = wav[:, :, context * samples_per_unit :].float()
+
+            yield (
+                texts,
+                BatchedSpeechOutput(
+                    units=[units_np[start : start + chunk_size]],
+                    audio_wavs=[chunk_wav],
+                    sample_rate=sample_rate,
+                ),
+            )
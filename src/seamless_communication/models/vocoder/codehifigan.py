@@ -3,10 +3,12 @@
 #
 # This source code is licensed under the license found in the
 # MIT_LICENSE file in the root directory of this source tree.
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
+from fairseq2.nn.padding import PaddingMask
 from torch import Tensor
 
 from seamless_communication.models.unity import VariancePredictor
@@ -72,20 +74,51 @@ class CodeGenerator(Generator):
         signal = signal.view(bsz, channels, max_frames)
         return signal
 
-    def forward(self, sample: Dict[str, Any], dur_prediction: bool) -> Tensor:  # type: ignore
+    def forward(  # type: ignore
+        self, sample: Dict[str, Any], dur_prediction: bool
+    ) -> Union[Tensor, Tuple[Tensor, Tensor]]:
         x = sample["code"]
+        # The number of valid (non-pad) units per batch item. When present, the
+        # output is a tuple of waveforms and their lengths in samples.
+        lens = sample.get("lens")
         x = self.dict(x).transpose(1, 2)
 
+        frame_lens = lens
         if self.dur_predictor and dur_prediction:
-            log_dur_pred = self.dur_predictor(x.transpose(1, 2), None)
+            dur_padding_mask = None
+            if lens is not None:
+                # Mask the trailing pad embeddings; the predictor's
+                # convolutions would otherwise bleed them into the durations
+                # of each item's last valid units, making batched output
+                # differ from solo synthesis.
+                dur_padding_mask = PaddingMask(lens, batch_seq_len=x.size(2))
+            log_dur_pred = self.dur_predictor(x.transpose(1, 2), dur_padding_mask)
             dur_out = torch.clamp(
                 torch.round((torch.exp(log_dur_pred) - 1)).long(), min=1
             )
             # B x C x T
             repeat_interleaved_x = []
             for i in range(x.size(0)):
-                repeat_interleaved_x.append(torch.repeat_interleave(x[i].unsqueeze(0), dur_out[i].view(-1), dim=2))
+                if lens is None:
+                    x_i, dur_i = x[i], dur_out[i]
+                else:
+                    # Skip the trailing pad units so that they don't get
+                    # durations predicted for them.
+                    x_i, dur_i = x[i, :, : lens[i]], dur_out[i, : lens[i]]
+                repeat_interleaved_x.append(
+                    torch.repeat_interleave(x_i.unsqueeze(0), dur_i.view(-1), dim=2)
+                )
+            if lens is not None:
+                frame_lens = torch.tensor(
+                    [x_i.size(2) for x_i in repeat_interleaved_x], device=x.device
+                )
+                max_frames = int(frame_lens.max())
+                repeat_interleaved_x = [
+                    F.pad(x_i, (0, max_frames - x_i.size(2)))
+                    for x_i in repeat_interleaved_x
+                ]
             x = torch.cat(repeat_interleaved_x)
+        num_frames = x.size(-1)
         upsampled_spkr = []
         upsampled_lang = []
         spkr = self.spkr(sample["spkr"]).transpose(1, 2)
@@ -98,4 +131,9 @@ class CodeGenerator(Generator):
         x = torch.cat([x, spkr], dim=1)
         x = torch.cat([lang, x], dim=1)
 
-        return super().forward(x)
+        wavs = super().forward(x)
+
+        if frame_lens is None:
+            return wavs
+
+        return wavs, frame_lens * (wavs.size(-1) // num_frames)
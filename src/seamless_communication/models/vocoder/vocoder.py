@@ -4,7 +4,7 @@
 # This source code is licensed under the license found in the
 # MIT_LICENSE file in the root directory of this source tree.
 
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Dict, Optional, List, Tuple, Union
 import torch
 from torch import Tensor
 from torch.nn import Module
@@ -21,6 +21,10 @@ class Vocoder(Module):
         super().__init__()
         self.code_generator = code_generator
         self.lang_spkr_idx_map = lang_spkr_idx_map
+        # Small speaker/language index tensors are identical across calls with
+        # the same languages and speakers, so cache them instead of allocating
+        # and uploading new ones on every forward.
+        self._spkr_lang_tensor_cache: Dict[Any, Tuple[Tensor, Tensor]] = {}
 
     def forward(
         self,
@@ -28,8 +32,16 @@ class Vocoder(Module):
         lang_list: Union[List[str], str],
         spkr_list: Union[Optional[List[int]], int] = None,
         dur_prediction: bool = True,
-    ) -> Tensor:
-        # TODO: Do we need this backward compatibility, or just update all calling sites? 
+        unit_lens: Optional[Tensor] = None,
+    ) -> Union[Tensor, Tuple[Tensor, Tensor]]:
+        """Synthesize a batch of unit sequences in a single pass.
+
+        If ``unit_lens`` holds the number of valid (non-pad) units per batch
+        item, trailing pad units are excluded from duration prediction and a
+        tuple of waveforms and their lengths in samples is returned; otherwise
+        only the waveforms are returned.
+        """
+        # TODO: Do we need this backward compatibility, or just update all calling sites?
         if len(units.shape) == 1:
             units = units.unsqueeze(0) # add batch dim
         if isinstance(lang_list, str):
@@ -40,10 +52,21 @@ class Vocoder(Module):
         if not spkr_list:
             spkr_list = [-1 for _ in range(len(lang_list))]
         spkr_list = [self.lang_spkr_idx_map["multispkr"][lang_list[i]][0] if spkr_list[i] == -1 else spkr_list[i] for i in range(len(spkr_list))]
+        cache_key = (tuple(spkr_list), tuple(lang_idx_list), units.device)
+        cached = self._spkr_lang_tensor_cache.get(cache_key)
+        if cached is None:
+            cached = (
+                torch.tensor([spkr_list], device=units.device).t(),
+                torch.tensor([lang_idx_list], device=units.device).t(),
+            )
+            self._spkr_lang_tensor_cache[cache_key] = cached
+        spkr_tensor, lang_tensor = cached
         x = {
             "code": units.view(units.size(0), -1),
-            "spkr": torch.tensor([spkr_list], device=units.device).t(),
-            "lang": torch.tensor([lang_idx_list], device=units.device).t(),
+            "spkr": spkr_tensor,
+            "lang": lang_tensor,
 
         }
+        if unit_lens is not None:
+            x["lens"] = unit_lens
         return self.code_generator(x, dur_prediction)  # type: ignore[no-any-return]
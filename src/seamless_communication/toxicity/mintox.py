@@ -12,7 +12,10 @@ import torch
 from torch.nn import functional as F
 
 
-from seamless_communication.inference import SequenceGeneratorOptions
+from seamless_communication.inference.generator import (
+    SequenceGeneratorOptions,
+    UnitYGenerator,
+)
 from seamless_communication.toxicity.etox_bad_word_checker import (
     ETOXBadWordChecker,
 )
@@ -25,6 +28,7 @@ from fairseq2.nn.padding import get_seqs_and_padding_mask
 from seamless_communication.models.unity import (
     UnitTokenizer,
     UnitYModel,
+    UnitYNART2UModel,
 )
 
 
@@ -111,7 +115,7 @@ def mintox_pipeline(
     prosody_encoder_input: Optional[SequenceData] = None,
 ) -> Tuple[List[StringLike], Optional[Tensor]]:
     """MinTox: Mitigation at INference time of added TOXicity."""
-    from seamless_communication.inference.translator import Modality, Translator
+    from seamless_communication.inference.translator import Modality
 
     if text_generation_opts is None:
         text_generation_opts = SequenceGeneratorOptions(
@@ -176,19 +180,27 @@ def mintox_pipeline(
                 index=indices_with_toxicity_tensor,
             )
         seqs, padding_mask = get_seqs_and_padding_mask(model_input)
-        # redo the prediction
-        new_texts, new_units = Translator.get_prediction(
-            model=model,
-            text_tokenizer=text_tokenizer,
-            unit_tokenizer=unit_tokenizer,
-            seqs=seqs,
-            padding_mask=padding_mask,
-            input_modality=input_modality,
-            output_modality=output_modality,
-            tgt_lang=tgt_lang,
-            unit_generation_ngram_filtering=unit_generation_ngram_filtering,
-            text_generation_opts=text_generation_opts,
-            unit_generation_opts=unit_generation_opts,
+        # redo the prediction. The generator carries the call-specific
+        # banned-sequence processor, so it is built directly rather than
+        # through a translator's generator cache.
+        if output_modality != Modality.SPEECH or isinstance(
+            model.t2u_model, UnitYNART2UModel
+        ):
+            unit_generation_opts = None
+        generator = UnitYGenerator(
+            model,
+            text_tokenizer,
+            tgt_lang,
+            unit_tokenizer if output_modality == Modality.SPEECH else None,
+            text_opts=text_generation_opts,
+            unit_opts=unit_generation_opts,
+        )
+        new_texts, new_units = generator(
+            seqs,
+            padding_mask,
+            input_modality.value,
+            output_modality.value,
+            ngram_filtering=unit_generation_ngram_filtering,
             duration_factor=duration_factor,
             prosody_encoder_input=prosody_encoder_input,
         )
@@ -0,0 +1,86 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# MIT_LICENSE file in the root directory of this source tree.
+
+import pytest
+import torch
+import torch.nn as nn
+from fairseq2.data import Collater
+from fairseq2.data.audio import WaveformToFbankConverter
+
+from seamless_communication.inference import Modality, Translator
+from tests.common import assert_equal, device
+
+
+def build_bare_translator(pad_to_multiple: int = 2) -> Translator:
+    """Build a `Translator` with only the attributes `_prepare_input` needs,
+    skipping the model downloads of `__init__`."""
+    translator = Translator.__new__(Translator)
+    nn.Module.__init__(translator)
+
+    translator.device = device
+    translator.pad_to_multiple = pad_to_multiple
+    translator.convert_to_fbank = WaveformToFbankConverter(
+        num_mel_bins=80,
+        waveform_scale=2**15,
+        channel_last=True,
+        standardize=True,
+        device=device,
+        dtype=torch.float32,
+    )
+    translator.collate = Collater(pad_value=0, pad_to_multiple=pad_to_multiple)
+    translator._token_encoders = {}
+
+    return translator
+
+
+class TestGetModalitiesFromTaskStr:
+    def test_returns_expected_modalities(self) -> None:
+        get_modalities = Translator.get_modalities_from_task_str
+
+        assert get_modalities("S2ST") == (Modality.SPEECH, Modality.SPEECH)
+        assert get_modalities("S2TT") == (Modality.SPEECH, Modality.TEXT)
+        assert get_modalities("ASR") == (Modality.SPEECH, Modality.TEXT)
+        assert get_modalities("T2TT") == (Modality.TEXT, Modality.TEXT)
+        assert get_modalities("T2ST") == (Modality.TEXT, Modality.SPEECH)
+
+    def test_is_case_insensitive(self) -> None:
+        assert Translator.get_modalities_from_task_str("t2tt") == (
+            Modality.TEXT,
+            Modality.TEXT,
+        )
+
+    def test_raises_error_when_task_is_not_supported(self) -> None:
+        with pytest.raises(ValueError, match=r"^Unsupported task: S2S$"):
+            Translator.get_modalities_from_task_str("S2S")
+
+
+class TestPrepareInput:
+    @pytest.mark.parametrize("pad_to_multiple", [2, 128])
+    def test_single_waveform_is_padded_in_place(self, pad_to_multiple: int) -> None:
+        translator = build_bare_translator(pad_to_multiple)
+
+        # ~0.6 seconds of audio at 16kHz.
+        audio = torch.sin(torch.arange(9760, dtype=torch.float32, device=device) / 10)
+
+        expected_fbank = translator.convert_to_fbank(
+            {"waveform": audio.unsqueeze(1), "sample_rate": 16000, "format": -1}
+        )["fbank"]
+
+        src = translator._prepare_input(audio, Modality.SPEECH, None, 16000)
+
+        seq_len = expected_fbank.size(0)
+        pad = -seq_len % pad_to_multiple
+
+        assert src["seqs"].shape == (1, seq_len + pad, 80)
+        assert int(src["seq_lens"][0]) == seq_len
+        assert bool(src["is_ragged"]) == (pad > 0)
+
+        assert_equal(src["seqs"][0, :seq_len], expected_fbank)
+        if pad > 0:
+            assert_equal(
+                src["seqs"][0, seq_len:],
+                torch.zeros(pad, 80, device=device),
+            )
@@ -0,0 +1,126 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# MIT_LICENSE file in the root directory of this source tree.
+
+import torch
+
+from seamless_communication.models.vocoder import CodeGenerator, Vocoder
+from tests.common import assert_equal, device
+
+# The upsample rates below multiply to an output of 4 samples per frame.
+UPSAMPLE_RATIO = 4
+
+
+def build_vocoder(with_dur_predictor: bool = True) -> Vocoder:
+    torch.manual_seed(2)
+
+    code_generator = CodeGenerator(
+        upsample_rates=[2, 2],
+        upsample_kernel_sizes=[4, 4],
+        upsample_initial_channel=16,
+        resblock_kernel_sizes=[3],
+        resblock_dilation_sizes=[[1, 3, 5]],
+        model_in_dim=16,
+        num_embeddings=20,
+        embedding_dim=8,
+        dur_predictor_params=(
+            {
+                "encoder_embed_dim": 8,
+                "var_pred_hidden_dim": 8,
+                "var_pred_kernel_size": 3,
+                "var_pred_dropout": 0.5,
+            }
+            if with_dur_predictor
+            else {}
+        ),
+        lang_embedding_dim=4,
+        num_langs=1,
+        spkr_embedding_dim=4,
+        num_spkrs=1,
+    ).to(device)
+
+    vocoder = Vocoder(
+        code_generator,
+        lang_spkr_idx_map={"multilingual": {"eng": 0}, "multispkr": {"eng": [0]}},
+    )
+    vocoder.eval()
+
+    return vocoder
+
+
+class TestVocoder:
+    def test_forward_without_unit_lens_returns_tensor(self) -> None:
+        vocoder = build_vocoder(with_dur_predictor=False)
+
+        units = torch.randint(0, 20, (2, 10), device=device)
+
+        wavs = vocoder(units, "eng", -1, dur_prediction=False)
+
+        assert isinstance(wavs, torch.Tensor)
+        assert wavs.shape == (2, 1, 10 * UPSAMPLE_RATIO)
+
+    def test_forward_with_unit_lens_returns_trimmed_lengths(self) -> None:
+        vocoder = build_vocoder(with_dur_predictor=False)
+
+        units = torch.randint(0, 20, (2, 10), device=device)
+        unit_lens = torch.tensor([10, 6], device=device)
+
+        wavs, wav_lens = vocoder(
+            units, "eng", -1, dur_prediction=False, unit_lens=unit_lens
+        )
+
+        assert wavs.shape == (2, 1, 10 * UPSAMPLE_RATIO)
+        assert_equal(wav_lens, unit_lens * UPSAMPLE_RATIO)
+
+        # The waveforms themselves must match the legacy tensor-only output.
+        legacy_wavs = vocoder(units, "eng", -1, dur_prediction=False)
+        assert_equal(wavs, legacy_wavs)
+
+    def test_dur_prediction_with_unit_lens_skips_pad_units(self) -> None:
+        vocoder = build_vocoder()
+
+        units = torch.randint(0, 20, (2, 10), device=device)
+        unit_lens = torch.tensor([10, 6], device=device)
+
+        wavs, wav_lens = vocoder(
+            units, "eng", -1, dur_prediction=True, unit_lens=unit_lens
+        )
+
+        assert wavs.dim() == 3
+        assert wavs.size(0) == 2
+        assert wav_lens.shape == (2,)
+        # Each length is a whole number of upsampled frames and the longest
+        # item fills the padded output.
+        assert (wav_lens % UPSAMPLE_RATIO == 0).all()
+        assert int(wav_lens.max()) == wavs.size(-1)
+
+        # The second item's length must only account for its 6 valid units:
+        # synthesizing them alone has to predict the same durations.
+        _, solo_lens = vocoder(
+            units[1:, :6],
+            "eng",
+            -1,
+            dur_prediction=True,
+            unit_lens=torch.tensor([6], device=device),
+        )
+        assert_equal(wav_lens[1:], solo_lens)
+
+    def test_dur_prediction_matches_legacy_output_for_full_lengths(self) -> None:
+        vocoder = build_vocoder()
+
+        units = torch.randint(0, 20, (1, 12), device=device)
+
+        legacy_wavs = vocoder(units, "eng", -1, dur_prediction=True)
+
+        wavs, wav_lens = vocoder(
+            units,
+            "eng",
+            -1,
+            dur_prediction=True,
+            unit_lens=torch.tensor([12], device=device),
+        )
+
+        assert int(wav_lens[0]) == wavs.size(-1)
+        assert_equal(wavs, legacy_wavs)